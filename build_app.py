@@ -8,6 +8,7 @@ import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def build_application():
@@ -35,13 +36,25 @@ def build_application():
         subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"])
     
     # Build command with proper parameters
+    # Note: onedir mode (no --onefile) is used intentionally - a onefile build
+    # has to self-extract the 100MB+ PyQt5/Flask bundle into a temp directory
+    # on every launch, which makes cold start several times slower.
     build_cmd = [
         "pyinstaller",
-        "--onefile",           # Create a single executable file
         "--windowed",          # Don't show console (for GUI apps)
         "--name=Orbit File Transfer",  # Set the application name
         "--add-data=templates;templates",  # Include templates directory
         "--icon=icon.ico",     # Use the application icon
+        "--noupx",             # UPX-compressed PyQt DLLs decompress serially at launch
+        "--hidden-import=waitress",  # Imported lazily in run_server()
+        "--hidden-import=orjson",    # Optional fast JSON encoder
+        "--optimize=2",        # Strip docstrings and asserts from bundled bytecode
+        # Prune stdlib packages the app never imports to shrink the bundle
+        "--exclude-module=tkinter",
+        "--exclude-module=unittest",
+        "--exclude-module=pydoc",
+        "--exclude-module=doctest",
+        "--exclude-module=test",
         "--clean",             # Clean cache before building
         "main.py"
     ]
@@ -50,43 +63,58 @@ def build_application():
     print(" ".join(build_cmd))
     
     try:
-        # Execute the build command
-        result = subprocess.run(build_cmd, check=True)
-        
+        # Run PyInstaller in-process - spawning the pyinstaller executable
+        # re-bootstraps an interpreter and re-imports PyInstaller's whole
+        # module graph on every build iteration
+        import PyInstaller.__main__
+        PyInstaller.__main__.run(build_cmd[1:])
+
         print("\nBuild completed successfully!")
-        print(f"Executable location: {os.path.join('dist', 'Orbit File Transfer.exe' if sys.platform.startswith('win') else 'Orbit File Transfer')}")
-        
+        exe_name = "Orbit File Transfer.exe" if sys.platform.startswith('win') else "Orbit File Transfer"
+        print(f"Executable location: {os.path.join('dist', 'Orbit File Transfer', exe_name)}")
+
         # Create a distribution folder with all necessary files
         dist_dir = "distribution"
         if os.path.exists(dist_dir):
             shutil.rmtree(dist_dir)
-        
+
         os.makedirs(dist_dir)
-        
-        # Copy the executable to distribution folder
-        exe_name = "Orbit File Transfer.exe" if sys.platform.startswith('win') else "Orbit File Transfer"
-        exe_path = os.path.join("dist", exe_name)
-        
-        if os.path.exists(exe_path):
-            shutil.copy2(exe_path, os.path.join(dist_dir, exe_name))
-        
-        # Copy documentation and icons to distribution folder
-        if os.path.exists("README.md"):
-            shutil.copy2("README.md", dist_dir)
-        
-        if os.path.exists("icon.png"):
-            shutil.copy2("icon.png", dist_dir)
-        
-        if os.path.exists("icon.ico"):
-            shutil.copy2("icon.ico", dist_dir)
-        
+
+        # Copy the whole application directory (onedir build) to distribution folder
+        app_dir = os.path.join("dist", "Orbit File Transfer")
+
+        # Pre-warm the import cache so launches can pre-load startup modules
+        try:
+            subprocess.run([sys.executable, "main.py", "--warmup"], check=True)
+            if os.path.exists(".orbit_cache.json") and os.path.exists(app_dir):
+                shutil.copy2(".orbit_cache.json", app_dir)
+        except Exception as e:
+            print(f"Warning: warmup step failed: {e}")
+
+        # Copy the app directory and the standalone docs/icons in parallel
+        # so the small files don't wait behind the big PyQt5 payload.
+        # shutil.copy2 already uses the platform zero-copy path internally.
+        copies = []
+        if os.path.exists(app_dir):
+            copies.append((shutil.copytree, app_dir, os.path.join(dist_dir, "Orbit File Transfer")))
+
+        for extra in ("README.md", "icon.png", "icon.ico"):
+            if os.path.exists(extra):
+                copies.append((shutil.copy2, extra, dist_dir))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(fn, src, dst) for fn, src, dst in copies]
+            for future in futures:
+                future.result()
+
+        # Zip the distribution folder for easy hand-off
+        archive_path = shutil.make_archive(dist_dir, 'zip', dist_dir)
+
         print(f"Distribution package created in '{dist_dir}' folder")
+        print(f"Distribution archive created: {archive_path}")
         print("\nTo run the application, execute the generated executable file.")
         return True
         
-    except subprocess.CalledProcessError as e:
-        print(f"\nBuild failed with error: {e}")
-        return False
     except Exception as e:
         print(f"\nAn error occurred during build: {e}")
         return False
@@ -7,23 +7,63 @@ Desktop application that allows mobile devices to upload files wirelessly
 __version__ = "2.0.22"
 
 import os
+import re
 import sys
+import uuid
 import socket
 import threading
 import subprocess
+import gzip
 import json
+import queue
+import time
+import hashlib
 import locale
+import functools
+import dataclasses
+import collections
+import concurrent.futures
+import tempfile
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from urllib.parse import quote
+from flask import Flask, render_template, request, jsonify, send_from_directory, Request, Response
 from werkzeug.utils import secure_filename
-from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QPushButton, QTextEdit, QProgressBar, QMessageBox, QComboBox
-from PyQt5.QtCore import QTimer, pyqtSignal, QObject, Qt
-from PyQt5.QtGui import QPixmap, QIcon
+from werkzeug.security import safe_join
+from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QPushButton, QTextEdit, QListView, QProgressBar, QMessageBox, QComboBox
+from PyQt5.QtCore import QTimer, QThread, QThreadPool, QRunnable, pyqtSignal, QObject, Qt
+from PyQt5.QtGui import QPixmap, QIcon, QImage, QStandardItemModel, QStandardItem
 from PyQt5.QtGui import QTextCursor
-import qrcode
-import io
+import importlib.util
 import base64
 
+
+def _lazy_import(name):
+    """Import a module lazily - the real import runs on first attribute access"""
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# qrcode pulls in PIL, which is only needed once the QR code is rendered;
+# defer the import so it doesn't slow down application startup
+qrcode = _lazy_import('qrcode')
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 if sys.platform == "win32":
     try:
         import wmi
@@ -34,6 +74,12 @@ if sys.platform == "win32":
 # Configuration
 UPLOAD_FOLDER = 'uploaded'
 DOWNLOAD_FOLDER = 'to_download'
+# Staging area for in-flight uploads; lives inside UPLOAD_FOLDER so the
+# finished file can be moved into place with a rename instead of a copy
+INCOMING_FOLDER = os.path.join(UPLOAD_FOLDER, '.incoming')
+# Cached thumbnails for the desktop grid; also a dot folder so the
+# upload scans and /status walk skip it
+THUMB_FOLDER = os.path.join(UPLOAD_FOLDER, '.thumbs')
 # Allow all file extensions since we want to support images, videos, and various Apple formats
 ALLOWED_EXTENSIONS = {''}  # Empty set means all extensions are allowed
 MAX_CONTENT_LENGTH = None  # No file size limit to accommodate large video files
@@ -46,16 +92,89 @@ VIDEO_EXTENSIONS = {'mp4', 'mkv', 'avi', 'mov', 'wmv', 'flv', 'webm', 'm4v'}
 # Media extensions (images + videos) for download page
 MEDIA_EXTENSIONS = IMAGE_EXTENSIONS.union(VIDEO_EXTENSIONS)
 
-# Device-specific upload subdirectories
-import re
+# Copy buffer for saving uploads; 4 MiB cuts read/write syscalls ~256x
+# versus Werkzeug's 16 KiB default, which is what limits throughput on
+# large video uploads
+COPY_BUFSIZE = 4 * 1024 * 1024
+
+# Worker pool for persisting uploads so disk writes run off the request
+# thread and a multi-file batch can overlap its saves
+IO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+# Pattern used to sanitize device names into valid folder names
+_SANITIZE_RE = re.compile(r'[^\w\-_.]')
 
 
 def allowed_file(filename):
     """Allow all file types since we want to support images, videos, and Apple formats"""
     return True
 
+class StreamingRequest(Request):
+    """Request that spools uploaded files straight into the upload folder
+
+    Werkzeug's default SpooledTemporaryFile buffers the POST body in
+    memory (or /tmp) and the save step then copies it to the destination -
+    a double write of up to the full file size. Spooling into a temp file
+    on the destination filesystem lets save_upload_stream() finish the
+    upload with a single rename.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        os.makedirs(INCOMING_FOLDER, exist_ok=True)
+        # The multipart parser writes in ~64 KiB pieces; a COPY_BUFSIZE
+        # write buffer batches those into far fewer write syscalls
+        spool = tempfile.NamedTemporaryFile('wb+', dir=INCOMING_FOLDER, prefix='upload-',
+                                            buffering=COPY_BUFSIZE, delete=False)
+        # Remember the path so request teardown can remove parts that
+        # never reach a save (aborted parse, rejected request, errors)
+        if not hasattr(self, '_spool_paths'):
+            self._spool_paths = []
+        self._spool_paths.append(spool.name)
+        return spool
+
+
 app = Flask(__name__)
+app.request_class = StreamingRequest
+
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class ORJSONProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson's C encoder (3-10x faster than stdlib)"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+# The templates never change while the app runs; without this Jinja
+# stats the template file on every render to check for edits
+app.jinja_env.auto_reload = False
+
+
+@app.teardown_request
+def _cleanup_spool_files(exc):
+    """Remove spool files the request never promoted to an upload
+
+    save_upload_stream renames finished spools away, so anything still
+    present here belongs to an aborted parse, a rejected request, or a
+    batch that errored partway - without this they linger until the
+    next launch's startup sweep.
+    """
+    for path in getattr(request, '_spool_paths', ()):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+# When running behind a reverse proxy that understands X-Sendfile /
+# X-Accel-Redirect (e.g. nginx), let the proxy stream file downloads
+# instead of pushing bytes through a Python worker thread. Off by
+# default because in the normal desktop setup there is no proxy.
+app.use_x_sendfile = os.environ.get('ORBIT_USE_X_SENDFILE', '') == '1'
 if MAX_CONTENT_LENGTH is not None:
     app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 else:
@@ -64,16 +183,20 @@ else:
 # Global variables
 current_ip = None
 transfer_status = {}
-upload_progress = {}
+upload_progress = collections.OrderedDict()  # session_id -> UploadSession, oldest first
+_progress_lock = threading.Lock()
+PROGRESS_MAX_SESSIONS = 256  # Cap on tracked upload sessions
+PROGRESS_TTL = 600.0  # Seconds before a finished session is evicted
 pending_log_entries = []  # Entries waiting to be added to the log
 current_language = 'zh'  # Default language
+# /status response cache; 'body' holds the serialized JSON bytes and is
+# reset whenever 'payload' changes so serialization happens once per
+# cache generation
+_status_cache = {'mtime': None, 'ts': 0, 'payload': None, 'body': None}
+_status_lock = threading.Lock()
 i18n_data = {}  # i18n data cache
 SETTINGS_FILE = 'settings.json'  # Settings file for language preference
-
-# Import for session management
-from flask import session
-import uuid
-
+WARMUP_CACHE_FILE = '.orbit_cache.json'  # Modules recorded by --warmup
 
 def load_i18n_data():
     """Load i18n data from JSON file"""
@@ -138,8 +261,18 @@ def save_settings():
         pass
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
-    """Get the local IP address of the machine"""
+    """Get the local IP address of the machine (cached for the process)
+
+    Use get_local_ip.cache_clear() to force re-detection after a network
+    change.
+    """
+    # The UDP connect trick asks the routing table which interface
+    # reaches the outside world, so it reliably picks the default-route
+    # adapter. getaddrinfo ordering is arbitrary and happily returns a
+    # VPN/Hyper-V/WSL address first, which would put an unreachable IP
+    # in the QR code - only use it as the offline fallback.
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
@@ -147,7 +280,24 @@ def get_local_ip():
         s.close()
         return ip
     except Exception:
-        return "127.0.0.1"
+        pass
+
+    try:
+        addresses = socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET)
+        for addr in addresses:
+            ip = addr[4][0]
+            if not ip.startswith('127.'):
+                return ip
+    except Exception:
+        pass
+
+    return "127.0.0.1"
+
+
+def refresh_local_ip():
+    """Drop the cached local IP and re-detect (e.g. after a network change)"""
+    get_local_ip.cache_clear()
+    return get_local_ip()
 
 
 def get_all_local_ips():
@@ -198,61 +348,405 @@ def get_interface_name_by_ip(ip):
     return "Network Interface"
 
 
-class CommunicationThread(QObject):
-    """Thread for handling Flask server communication"""
+def run_server(flask_app):
+    """Run the web server, preferring waitress over the Werkzeug dev server"""
+    # Slow mobile uploads and open /events streams occupy a worker
+    # thread each, so the pool must comfortably exceed the subscriber
+    # cap; allow raising it further for many-device setups
+    try:
+        server_threads = int(os.environ.get('ORBIT_SERVER_THREADS', '32'))
+    except ValueError:
+        server_threads = 32
+
+    try:
+        from waitress import serve
+    except ImportError:
+        # Fall back to the development server if waitress isn't available
+        flask_app.run(host='0.0.0.0', port=5000, debug=False, threaded=True, use_reloader=False)
+        return
+
+    # Bind the listener ourselves so the socket options are set before
+    # waitress starts accepting: TCP_NODELAY avoids Nagle delays on the
+    # small JSON/status responses, and 1 MiB kernel buffers keep large
+    # uploads streaming over Wi-Fi latency instead of stalling on the
+    # default window size.
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1024 * 1024)
+    listener.bind(('0.0.0.0', 5000))
+    listener.listen(128)
+
+    serve(flask_app, sockets=[listener], threads=server_threads,
+          channel_timeout=120, cleanup_interval=30, recv_bytes=262144,
+          _quiet=True)
+
+
+class CommunicationThread(QThread):
+    """Thread for handling Flask server communication
+
+    Runs as a QThread so update_signal emissions from server request
+    threads are delivered to the GUI through Qt's queued-connection
+    bridge instead of touching widgets cross-thread.
+    """
     update_signal = pyqtSignal(str)
-    
+    # Emitted as soon as the IP is detected, so the GUI can start the
+    # QR render immediately instead of waiting for a fixed timer
+    ip_ready = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.app = app
-        
+
     def run(self):
         global current_ip
         current_ip = get_local_ip()
-        
-        # Start the Flask server
-        self.app.run(host='0.0.0.0', port=5000, debug=False, threaded=True, use_reloader=False)
+        self.ip_ready.emit()
+
+        # Start the web server
+        run_server(self.app)
+
+
+# Set once the GUI starts the server thread; lets the upload route push
+# refresh events to the desktop window instead of relying on polling
+comm_thread = None
+
+
+# Rendered page bodies plus their gzip blobs, keyed by template name.
+# The pages contain no request-time Jinja interpolation, so one render
+# and one max-level compression serve every subsequent hit.
+_page_cache = {}
+_page_lock = threading.Lock()
+
+
+def _render_page(template, **context):
+    """Render a page once and serve it gzip-compressed when accepted"""
+    with _page_lock:
+        cached = _page_cache.get(template)
+        if cached is None:
+            body = render_template(template, **context).encode('utf-8')
+            cached = (body, gzip.compress(body, compresslevel=9))
+            _page_cache[template] = cached
+
+    body, blob = cached
+    if 'gzip' in request.headers.get('Accept-Encoding', '').lower():
+        return Response(blob, mimetype='text/html',
+                        headers={'Content-Encoding': 'gzip',
+                                 'Vary': 'Accept-Encoding'})
+    return Response(body, mimetype='text/html',
+                    headers={'Vary': 'Accept-Encoding'})
 
 
 @app.route('/')
 def index():
     """Serve the mobile device interface"""
-    return render_template('index.html', version=__version__)
+    return _render_page('index.html', version=__version__)
 
 
 @app.route('/desktop')
 def desktop_view():
     """Serve the desktop interface"""
-    return render_template('desktop.html')
+    return _render_page('desktop.html')
 
 
-def get_device_folder(user_agent):
-    """Generate a device-specific folder name based on user agent"""
+# One scan instead of five substring checks; group names double as the
+# folder names
+_UA_RE = re.compile(r'(?P<iPhone>iPhone|iPad)|(?P<Android>Android)|(?P<Windows_PC>Windows)|(?P<Mac>Macintosh|Mac OS X)')
+
+# Device folders whose os.makedirs has already been issued
+_device_folders_created = set()
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_device(user_agent):
+    """Map a user-agent string to a sanitized device folder name"""
     if not user_agent:
         return 'unknown_device'
-    
-    # Try to extract device info from user agent
-    if 'iPhone' in user_agent or 'iPad' in user_agent:
-        device_name = 'iPhone'
-    elif 'Android' in user_agent:
-        device_name = 'Android'
-    elif 'Windows' in user_agent:
-        device_name = 'Windows_PC'
-    elif 'Macintosh' in user_agent or 'Mac OS X' in user_agent:
-        device_name = 'Mac'
-    else:
-        device_name = 'Unknown_Device'
-    
+
+    match = _UA_RE.search(user_agent)
+    device_name = match.lastgroup if match else 'Unknown_Device'
+
     # Sanitize the device name to be a valid folder name
-    sanitized_device_name = re.sub(r'[^\w\-_.]', '_', device_name)
-    device_folder = os.path.join(app.config['UPLOAD_FOLDER'], sanitized_device_name)
-    
-    # Create the folder if it doesn't exist
-    os.makedirs(device_folder, exist_ok=True)
-    
+    return _SANITIZE_RE.sub('_', device_name)
+
+
+def get_device_folder(user_agent):
+    """Generate a device-specific folder name based on user agent"""
+    device_folder = os.path.join(app.config['UPLOAD_FOLDER'], _classify_device(user_agent))
+
+    # Create the folder if it doesn't exist (once per distinct folder)
+    if device_folder not in _device_folders_created:
+        os.makedirs(device_folder, exist_ok=True)
+        _device_folders_created.add(device_folder)
+
     return device_folder
 
 
+# Filenames already present per device folder, so duplicate resolution is
+# a set lookup instead of a stat call per candidate name
+_known_files = {}
+_known_files_lock = threading.Lock()
+# (device_folder, filename) -> next numbered suffix to try, so repeat
+# uploads of the same name skip straight past the suffixes already taken
+_suffix_hints = {}
+
+
+def reserve_filepath(device_folder, filename):
+    """Pick a collision-free path in device_folder and reserve it on disk
+
+    The final os.open with O_CREAT|O_EXCL makes the reservation atomic, so
+    concurrent uploads of the same filename cannot race each other into
+    the same path.
+    """
+    name, ext = os.path.splitext(filename)
+    with _known_files_lock:
+        known = _known_files.get(device_folder)
+        if known is None:
+            try:
+                with os.scandir(device_folder) as it:
+                    known = {entry.name for entry in it}
+            except FileNotFoundError:
+                # Folder removed since get_device_folder cached it
+                os.makedirs(device_folder, exist_ok=True)
+                known = set()
+            _known_files[device_folder] = known
+
+        candidate = filename
+        counter = _suffix_hints.get((device_folder, filename), 1)
+        while True:
+            if candidate not in known:
+                filepath = os.path.join(device_folder, candidate)
+                try:
+                    os.close(os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+                except FileExistsError:
+                    # Created by someone outside this process; remember it
+                    known.add(candidate)
+                except FileNotFoundError:
+                    # The device folder was deleted out from under us (the
+                    # GUI's open-folder button makes that easy); re-create
+                    # it, rebuild the stale name cache, and start over so
+                    # the original name isn't skipped for a dead duplicate
+                    os.makedirs(device_folder, exist_ok=True)
+                    with os.scandir(device_folder) as it:
+                        known = {entry.name for entry in it}
+                    _known_files[device_folder] = known
+                    _suffix_hints.pop((device_folder, filename), None)
+                    candidate = filename
+                    counter = 1
+                    continue
+                else:
+                    known.add(candidate)
+                    if candidate != filename:
+                        _suffix_hints[(device_folder, filename)] = counter
+                    return filepath
+            candidate = f"{name}_{counter}{ext}"
+            counter += 1
+
+
+def _drop_page_cache(filepath):
+    """Hint the kernel to drop the file's page cache (no-op off Linux)
+
+    Saved uploads are rarely read back right away, so there is no point
+    letting a multi-GB video evict everything else from RAM.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _digest_file(fileobj):
+    """Hash an open binary file with blake2b
+
+    hashlib.file_digest runs the whole read/update loop in C with large
+    buffers; fall back to a manual loop on interpreters without it.
+    """
+    if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+        return hashlib.file_digest(fileobj, 'blake2b')
+    hasher = hashlib.blake2b()
+    while True:
+        chunk = fileobj.read(COPY_BUFSIZE)
+        if not chunk:
+            break
+        hasher.update(chunk)
+    return hasher
+
+
+def save_upload_stream(stream, filepath):
+    """Save an uploaded stream to disk and return its content etag
+
+    The etag (blake2b hex digest; notably faster per byte than md5) lets
+    clients verify what landed on disk without a second request.
+    """
+    tmp_name = getattr(stream, 'name', None)
+    if isinstance(tmp_name, str) and os.path.dirname(os.path.abspath(tmp_name)) == os.path.abspath(INCOMING_FOLDER):
+        # The stream was already written to the destination filesystem by
+        # StreamingRequest; a rename moves it into place without re-copying.
+        # The hash pass re-reads from the still-warm page cache.
+        stream.close()
+        os.replace(tmp_name, filepath)
+        with open(filepath, 'rb') as src:
+            hasher = _digest_file(src)
+    else:
+        hasher = hashlib.blake2b()
+        with open(filepath, 'wb') as dst:
+            while True:
+                chunk = stream.read(COPY_BUFSIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                dst.write(chunk)
+    _drop_page_cache(filepath)
+    return hasher.hexdigest()
+
+
+@dataclasses.dataclass(slots=True)
+class UploadSession:
+    """Per-upload progress tracked for /progress polling
+
+    Slots keep the per-session footprint small compared to the previous
+    dict-of-dicts representation.
+    """
+    progress: int = 0
+    status: str = 'starting'
+    total_files: int = 0
+    uploaded_files: list = dataclasses.field(default_factory=list)
+    current_file: str = None
+    created_at: float = dataclasses.field(default_factory=time.monotonic)
+
+
+def _trim_progress():
+    """Evict stale or excess upload sessions; caller must hold _progress_lock"""
+    now = time.monotonic()
+    stale = [sid for sid, session in upload_progress.items()
+             if now - session.created_at > PROGRESS_TTL]
+    for sid in stale:
+        del upload_progress[sid]
+    while len(upload_progress) > PROGRESS_MAX_SESSIONS:
+        upload_progress.popitem(last=False)
+
+
+def _progress_snapshot():
+    """Copy the progress map under its lock for safe serialization
+
+    Other waitress threads trim and mutate upload_progress concurrently;
+    iterating it unlocked can raise mid-comprehension.
+    """
+    with _progress_lock:
+        return {sid: dataclasses.asdict(session)
+                for sid, session in upload_progress.items()}
+
+
+def _update_status_cache(device_name, file_infos):
+    """Fold freshly uploaded files into the cached /status payload
+
+    Keeps the cache warm after an upload instead of forcing the next poll
+    to re-walk the whole tree; falls back to plain invalidation when
+    nothing is cached yet.
+    """
+    with _status_lock:
+        payload = _status_cache['payload']
+        if payload is None:
+            _status_cache['mtime'] = None
+            return
+
+        for folder in payload['device_folders']:
+            if folder['name'] == device_name:
+                break
+        else:
+            folder = {'name': device_name, 'files': []}
+            payload['device_folders'].append(folder)
+
+        for info in file_infos:
+            rel_path = f"{device_name}/{info['filename']}"
+            try:
+                mtime_ns = os.stat(os.path.join(UPLOAD_FOLDER, rel_path)).st_mtime_ns
+            except OSError:
+                mtime_ns = 0
+            url, thumb_url = _versioned_urls(rel_path, info['size'], mtime_ns)
+            folder['files'].append({
+                'name': info['filename'],
+                'size': info['size'],
+                'timestamp': info['timestamp'],
+                'device_folder': device_name,
+                'url': url,
+                'thumb_url': thumb_url
+            })
+
+        payload['total_files'] += len(file_infos)
+        _status_cache['ts'] = time.monotonic()
+        _status_cache['body'] = None  # payload changed; re-serialize lazily
+        # The upload bumped the device folder's mtime; without refreshing
+        # the fingerprint the next /status would see a mismatch and
+        # re-walk anyway, throwing the folded entries away
+        _status_cache['mtime'] = _folder_fingerprint()
+
+
+# Server-Sent Events plumbing: one queue per connected browser. Upload
+# handlers broadcast change notifications so the web pages refresh on
+# demand instead of re-fetching /status every few seconds.
+_event_subscribers = set()
+_event_lock = threading.Lock()
+# Each open stream pins a waitress worker for the life of the tab, so
+# cap them below the worker pool; over-cap clients get a 503 and fall
+# back to slow polling
+EVENT_SUBSCRIBERS_MAX = 16
+
+
+def broadcast_event(event):
+    """Push an event dict to every /events subscriber without blocking"""
+    with _event_lock:
+        subscribers = list(_event_subscribers)
+    for q in subscribers:
+        try:
+            q.put_nowait(event)
+        except queue.Full:
+            # A wedged client keeps its backlog; drop rather than stall uploads
+            pass
+
+
+@app.route('/events')
+def events():
+    """Server-Sent Events stream of upload notifications
+
+    Each subscriber gets its own bounded queue; the generator blocks on
+    it (with a keep-alive comment on timeout so proxies and the waitress
+    channel_timeout don't reap idle streams) and so costs nothing while
+    nothing is uploaded. When the subscriber cap is hit, refuse with a
+    503 so uploads and /status keep getting worker threads; the pages
+    poll instead.
+    """
+    q = queue.Queue(maxsize=64)
+    with _event_lock:
+        if len(_event_subscribers) >= EVENT_SUBSCRIBERS_MAX:
+            return jsonify({'error': 'too many event streams'}), 503
+        _event_subscribers.add(q)
+
+    def stream():
+        try:
+            yield 'retry: 2000\n\n'
+            while True:
+                try:
+                    event = q.get(timeout=30)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield f'data: {json.dumps(event)}\n\n'
+        finally:
+            with _event_lock:
+                _event_subscribers.discard(q)
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
     """Handle file uploads from mobile device"""
@@ -271,49 +765,54 @@ def upload_file():
     
     # Create a unique session for this upload
     session_id = str(uuid.uuid4())
-    upload_progress[session_id] = {'progress': 0, 'status': 'starting', 'total_files': len(files), 'uploaded_files': [], 'current_file': None}
+    session = UploadSession(total_files=len(files))
+    with _progress_lock:
+        upload_progress[session_id] = session
+        _trim_progress()
     
     uploaded_files = []
     new_log_entries = []
-    
+
     try:
+        pending_saves = []
         for idx, file in enumerate(files):
             if file and allowed_file(file.filename):
                 # Update progress and current file info
-                upload_progress[session_id]['progress'] = int((idx / len(files)) * 100)
-                upload_progress[session_id]['status'] = f'Uploading file {idx+1} of {len(files)}: {secure_filename(file.filename)}'
-                upload_progress[session_id]['current_file'] = secure_filename(file.filename)
-                
+                # Sanitize once per file; secure_filename runs several
+                # regex passes and was previously called three times here
                 filename = secure_filename(file.filename)
-                filepath = os.path.join(device_folder, filename)
-                
+
+                session.progress = int((idx / len(files)) * 100)
+                session.status = f'Uploading file {idx+1} of {len(files)}: {filename}'
+                session.current_file = filename
+
                 # Handle duplicate filenames
-                counter = 1
-                original_filepath = filepath
-                while os.path.exists(filepath):
-                    name, ext = os.path.splitext(original_filepath)
-                    filepath = f"{os.path.join(device_folder, f'{name}_{counter}{ext}')}"
-                    counter += 1
-                
-                # Save the file
-                file.save(filepath)
-                file_info = {
-                    'filename': os.path.basename(filepath),
-                    'size': os.path.getsize(filepath),
-                    'device_folder': os.path.basename(device_folder),
-                    'timestamp': datetime.now().isoformat()
-                }
-                uploaded_files.append(file_info)
-                upload_progress[session_id]['uploaded_files'].append(file_info)
-                
-                # Collect log entry for this file
-                rel_path = os.path.join(file_info['device_folder'], file_info['filename'])
-                new_log_entries.append(f"{rel_path} - UPLOADED ({file_info['size']} bytes)")
-        
+                filepath = reserve_filepath(device_folder, filename)
+
+                # Hand the disk write to the I/O pool so a multi-file
+                # batch persists its files concurrently
+                pending_saves.append((IO_EXECUTOR.submit(save_upload_stream, file.stream, filepath), filepath))
+
+        for future, filepath in pending_saves:
+            etag = future.result()
+            file_info = {
+                'filename': os.path.basename(filepath),
+                'size': os.path.getsize(filepath),
+                'device_folder': os.path.basename(device_folder),
+                'timestamp': datetime.now().isoformat(),
+                'etag': etag
+            }
+            uploaded_files.append(file_info)
+            session.uploaded_files.append(file_info)
+
+            # Collect log entry for this file
+            rel_path = os.path.join(file_info['device_folder'], file_info['filename'])
+            new_log_entries.append(f"{rel_path} - UPLOADED ({file_info['size']} bytes)")
+
         # Update progress to 100% after successful upload
-        upload_progress[session_id]['progress'] = 100
-        upload_progress[session_id]['status'] = 'completed'
-        upload_progress[session_id]['current_file'] = None
+        session.progress = 100
+        session.status = 'completed'
+        session.current_file = None
         
         # Add summary log entry
         success_count = len(uploaded_files)
@@ -323,10 +822,20 @@ def upload_file():
         
         # Add all new entries to pending log
         pending_log_entries.extend(new_log_entries)
-        
+
+        # Keep the /status cache in sync with the new files
+        _update_status_cache(os.path.basename(device_folder), uploaded_files)
+
+        # Nudge the desktop window to refresh right away
+        if comm_thread is not None:
+            comm_thread.update_signal.emit(f"{len(uploaded_files)} file(s) uploaded")
+
+        # Wake the browser pages listening on /events
+        broadcast_event({'type': 'file_added', 'count': len(uploaded_files)})
+
     except Exception as e:
-        upload_progress[session_id]['progress'] = 0
-        upload_progress[session_id]['status'] = f'error: {str(e)}'
+        session.progress = 0
+        session.status = f'error: {str(e)}'
         return jsonify({'success': False, 'error': str(e)}), 500
     
     return jsonify({
@@ -334,60 +843,326 @@ def upload_file():
         'session_id': session_id,
         'device_folder': os.path.basename(device_folder),
         'message': f'{len(uploaded_files)} file(s) uploaded successfully to {os.path.basename(device_folder)}',
-        'files': uploaded_files
+        'files': uploaded_files,
+        # Per-file result map so batch clients can verify each upload
+        'results': {info['filename']: {'error': False, 'etag': info['etag']}
+                    for info in uploaded_files}
     })
 
 
-@app.route('/uploads/<filename>')
+@app.route('/upload_stream', methods=['POST', 'PUT'])
+def upload_stream():
+    """Stream a single file from the raw request body straight to disk
+
+    Skips multipart parsing entirely; the client sends the file bytes as
+    the request body with the name in an X-Filename header (or a
+    ?filename= query parameter). Useful for large videos where parser
+    overhead dominates the upload.
+    """
+    global pending_log_entries
+
+    filename = secure_filename(request.headers.get('X-Filename', '')
+                               or request.args.get('filename', ''))
+    if not filename:
+        return jsonify({'error': 'No filename provided'}), 400
+
+    user_agent = request.headers.get('User-Agent', '')
+    device_folder = get_device_folder(user_agent)
+    filepath = reserve_filepath(device_folder, filename)
+
+    try:
+        hasher = hashlib.blake2b()
+        with open(filepath, 'wb') as dst:
+            while True:
+                chunk = request.stream.read(COPY_BUFSIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                dst.write(chunk)
+        _drop_page_cache(filepath)
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    file_info = {
+        'filename': os.path.basename(filepath),
+        'size': os.path.getsize(filepath),
+        'device_folder': os.path.basename(device_folder),
+        'timestamp': datetime.now().isoformat(),
+        'etag': hasher.hexdigest()
+    }
+
+    rel_path = os.path.join(file_info['device_folder'], file_info['filename'])
+    pending_log_entries.append(f"{rel_path} - UPLOADED ({file_info['size']} bytes)")
+    _update_status_cache(file_info['device_folder'], [file_info])
+    if comm_thread is not None:
+        comm_thread.update_signal.emit('1 file uploaded')
+    broadcast_event({'type': 'file_added', 'count': 1})
+
+    return jsonify({'success': True, 'file': file_info})
+
+
+def _versioned_urls(rel_path, size, mtime_ns):
+    """Build cache-busting file and thumbnail URLs for a status entry
+
+    The v token changes whenever the file's bytes do, so responses for
+    these URLs can be cached as immutable: repeat grid renders then hit
+    the browser's disk cache with zero network traffic.
+    """
+    v = f'{mtime_ns ^ size:x}'[-8:]
+    quoted = quote(rel_path)
+    return f'/uploads/{quoted}?v={v}', f'/thumb/{quoted}?v={v}'
+
+
+def _immutable_if_versioned(response):
+    """Mark a file response as immutable when fetched via a ?v= URL"""
+    if request.args.get('v'):
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    return response
+
+
+@app.route('/uploads/<path:filename>')
 def uploaded_file(filename):
-    """Serve uploaded files"""
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    """Serve uploaded files, including those inside device subfolders
+
+    The path converter accepts names like iPhone/photo.jpg;
+    send_from_directory still rejects anything escaping the upload
+    folder. conditional + max_age let the browser answer repeat
+    thumbnail loads from its cache (or a cheap 304) instead of
+    re-downloading the file on every desktop page refresh.
+    """
+    return _immutable_if_versioned(
+        send_from_directory(app.config['UPLOAD_FOLDER'], filename,
+                            conditional=True, max_age=3600))
+
+
+@app.route('/thumb/<path:filename>')
+def thumbnail(filename):
+    """Serve a small cached thumbnail of an uploaded image
+
+    The desktop grid was loading full-size originals as 150px
+    thumbnails; this renders a 150x150 JPEG once into THUMB_FOLDER and
+    serves that (~100x fewer bytes for a phone photo) with a long
+    max_age. Non-image files fall back to the original.
+    """
+    source = safe_join(app.config['UPLOAD_FOLDER'], filename)
+    if source is None or not os.path.isfile(source):
+        return jsonify({'error': 'File not found'}), 404
+
+    thumb_name = filename + '.jpg'
+    thumb_path = os.path.join(THUMB_FOLDER, thumb_name)
+    # A thumbnail is only reused while it is at least as new as its
+    # source, so a re-uploaded file under the same name re-renders
+    try:
+        thumb_fresh = os.path.getmtime(thumb_path) >= os.path.getmtime(source)
+    except OSError:
+        thumb_fresh = False
+    if not thumb_fresh:
+        try:
+            from PIL import Image
+            os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+            with Image.open(source) as img:
+                img.thumbnail((150, 150))
+                if img.mode not in ('RGB', 'L'):
+                    img = img.convert('RGB')
+                # Render to a temp file and rename into place so a
+                # concurrent request is never served (and told to cache
+                # for a year) a half-written JPEG
+                tmp = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(thumb_path),
+                                                  suffix='.tmp', delete=False)
+                try:
+                    with tmp:
+                        img.save(tmp, 'JPEG', quality=75, optimize=True, progressive=True)
+                    os.replace(tmp.name, thumb_path)
+                except Exception:
+                    os.unlink(tmp.name)
+                    raise
+        except Exception:
+            # Not an image (or Pillow unavailable); serve the original
+            return _immutable_if_versioned(
+                send_from_directory(app.config['UPLOAD_FOLDER'], filename,
+                                    conditional=True, max_age=3600))
+
+    return _immutable_if_versioned(
+        send_from_directory(THUMB_FOLDER, thumb_name,
+                            conditional=True, max_age=86400))
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso(ts_seconds):
+    """Format a whole-second timestamp as ISO 8601 (cached)
+
+    datetime.fromtimestamp().isoformat() is surprisingly slow, and file
+    mtimes rarely change between /status polls, so the cache hit rate is
+    very high.
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(ts_seconds))
+
+
+def _serialized_status(payload):
+    """Build the /status response, reusing cached JSON bytes
+
+    Caller must hold _status_lock. With orjson available the payload is
+    serialized once per cache generation and the bytes handed straight
+    to a Response, skipping jsonify's per-request encode; stdlib Flask
+    JSON is the fallback.
+    """
+    if orjson is None:
+        return jsonify(payload)
+    body = _status_cache['body']
+    if body is None:
+        body = orjson.dumps(payload)
+        _status_cache['body'] = body
+    return Response(body, mimetype='application/json')
+
+
+def _folder_fingerprint():
+    """Newest mtime across the upload folder and its device subfolders
+
+    Adding a file to a device subfolder bumps only that subfolder's
+    mtime, not the parent's, so the cache key has to cover both levels.
+    One scandir of the root is still far cheaper than the full walk.
+    """
+    try:
+        newest = os.stat(UPLOAD_FOLDER).st_mtime_ns
+    except OSError:
+        return None
+    try:
+        with os.scandir(UPLOAD_FOLDER) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    newest = max(newest, entry.stat().st_mtime_ns)
+    except OSError:
+        pass
+    return newest
+
+
+def _is_internal_event(event):
+    """True when a watchdog event touches the internal dot folders
+
+    The .incoming spool churns on every write of a streamed upload and
+    .thumbs on every render; the folder scans deliberately skip both,
+    so their events must not invalidate caches or trigger refreshes.
+    """
+    for path in (getattr(event, 'src_path', ''), getattr(event, 'dest_path', '')):
+        if not path:
+            continue
+        rel = os.path.relpath(path, UPLOAD_FOLDER)
+        if any(part.startswith('.') for part in rel.split(os.sep)):
+            return True
+    return False
+
+
+class _StatusCacheWatcher(FileSystemEventHandler):
+    """Invalidates the /status cache on filesystem events
+
+    Catches changes the upload routes never see (files dropped into or
+    deleted from the folder externally), so the cached payload is only
+    ever one event behind rather than a TTL behind.
+    """
+
+    def on_any_event(self, event):
+        if _is_internal_event(event):
+            return
+        with _status_lock:
+            _status_cache['mtime'] = None
+            _status_cache['body'] = None
+
+
+def _start_status_watcher():
+    """Watch the upload folder to invalidate the /status cache
+
+    No-op when watchdog isn't installed; the mtime fingerprint and TTL
+    then remain the only invalidation.
+    """
+    if Observer is None:
+        return
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(_StatusCacheWatcher(), UPLOAD_FOLDER, recursive=True)
+    observer.start()
 
 
 @app.route('/status')
 def get_status():
     """Get current upload status"""
+    # Both web clients hit this route on every change event; skip the
+    # directory walk entirely when nothing moved since the last request
+    folder_mtime = _folder_fingerprint()
+
+    with _status_lock:
+        if (folder_mtime is not None
+                and folder_mtime == _status_cache['mtime']
+                and time.monotonic() - _status_cache['ts'] < 2.0
+                and _status_cache['payload'] is not None):
+            return _serialized_status(_status_cache['payload'])
+
     files = []
     device_folders = []
-    
+
     if os.path.exists(UPLOAD_FOLDER):
-        for item in os.listdir(UPLOAD_FOLDER):
-            item_path = os.path.join(UPLOAD_FOLDER, item)
-            if os.path.isdir(item_path):
-                # This is a device folder
-                device_folders.append({
-                    'name': item,
-                    'files': []
-                })
-                
-                # Get files in this device folder
-                for filename in os.listdir(item_path):
-                    file_path = os.path.join(item_path, filename)
-                    if os.path.isfile(file_path):
-                        device_folders[-1]['files'].append({
-                            'name': filename,
-                            'size': os.path.getsize(file_path),
-                            'timestamp': datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat(),
-                            'device_folder': item
-                        })
-            elif os.path.isfile(item_path):
-                # This is a file in the root uploaded folder
-                files.append({
-                    'name': item,
-                    'size': os.path.getsize(item_path),
-                    'timestamp': datetime.fromtimestamp(os.path.getmtime(item_path)).isoformat(),
-                    'device_folder': 'root'
-                })
+        # os.scandir caches stat results per entry, so each file costs a
+        # single syscall instead of separate isdir/isfile/getsize/getmtime calls
+        with os.scandir(UPLOAD_FOLDER) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    # Skip internal folders such as the upload staging area
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    # This is a device folder
+                    device_folders.append({
+                        'name': entry.name,
+                        'files': []
+                    })
+
+                    # Get files in this device folder
+                    with os.scandir(entry.path) as sub_it:
+                        for sub_entry in sub_it:
+                            if sub_entry.is_file(follow_symlinks=False):
+                                st = sub_entry.stat()
+                                url, thumb_url = _versioned_urls(
+                                    f'{entry.name}/{sub_entry.name}', st.st_size, st.st_mtime_ns)
+                                device_folders[-1]['files'].append({
+                                    'name': sub_entry.name,
+                                    'size': st.st_size,
+                                    'timestamp': _iso(st.st_mtime_ns // 10**9),
+                                    'device_folder': entry.name,
+                                    'url': url,
+                                    'thumb_url': thumb_url
+                                })
+                elif entry.is_file(follow_symlinks=False):
+                    # This is a file in the root uploaded folder
+                    st = entry.stat()
+                    url, thumb_url = _versioned_urls(entry.name, st.st_size, st.st_mtime_ns)
+                    files.append({
+                        'name': entry.name,
+                        'size': st.st_size,
+                        'timestamp': _iso(st.st_mtime_ns // 10**9),
+                        'device_folder': 'root',
+                        'url': url,
+                        'thumb_url': thumb_url
+                    })
     
-    return jsonify({
+    payload = {
         'ip_address': current_ip,
         'connected': True,
         'files': files,
         'device_folders': device_folders,
         'total_files': sum(len(folder['files']) for folder in device_folders) + len(files),
-        'upload_progress': upload_progress,
+        'upload_progress': _progress_snapshot(),
         'language': current_language
-    })
+    }
+
+    with _status_lock:
+        _status_cache['mtime'] = folder_mtime
+        _status_cache['ts'] = time.monotonic()
+        _status_cache['payload'] = payload
+        _status_cache['body'] = None
+        return _serialized_status(payload)
 
 
 @app.route('/i18n')
@@ -405,7 +1180,10 @@ def get_i18n():
 @app.route('/progress/<session_id>')
 def get_progress(session_id):
     """Get upload progress for a specific session"""
-    progress = upload_progress.get(session_id, {'progress': 0, 'status': 'not started'})
+    with _progress_lock:
+        _trim_progress()
+        session = upload_progress.get(session_id)
+        progress = dataclasses.asdict(session) if session is not None else {'progress': 0, 'status': 'not started'}
     return jsonify(progress)
 
 
@@ -415,7 +1193,7 @@ def download_page():
     # Create download folder if it doesn't exist
     if not os.path.exists(DOWNLOAD_FOLDER):
         os.makedirs(DOWNLOAD_FOLDER, exist_ok=True)
-    return render_template('download.html', version=__version__)
+    return _render_page('download.html', version=__version__)
 
 
 def is_media_file(filename):
@@ -432,11 +1210,12 @@ def get_download_list():
         os.makedirs(DOWNLOAD_FOLDER, exist_ok=True)
     else:
         try:
-            # Get all files in download folder
-            for filename in os.listdir(DOWNLOAD_FOLDER):
-                file_path = os.path.join(DOWNLOAD_FOLDER, filename)
-                if os.path.isfile(file_path) and is_media_file(filename):
-                    images.append(filename)
+            # scandir reuses the readdir type info, so the is-file check
+            # costs no extra stat per entry (listdir+isfile did one each)
+            with os.scandir(DOWNLOAD_FOLDER) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False) and is_media_file(entry.name):
+                        images.append(entry.name)
             # Sort alphabetically
             images.sort()
         except Exception:
@@ -455,7 +1234,8 @@ def download_image(filename):
         os.makedirs(DOWNLOAD_FOLDER, exist_ok=True)
     
     try:
-        return send_from_directory(DOWNLOAD_FOLDER, filename)
+        return send_from_directory(DOWNLOAD_FOLDER, filename,
+                                   conditional=True, max_age=3600)
     except Exception as e:
         return jsonify({'error': str(e)}), 404
 
@@ -463,7 +1243,123 @@ def download_image(filename):
 
 
 
+class _FolderScanTask(QRunnable):
+    """Scans the upload folder on the global thread pool
+
+    Walking a large upload folder can take long enough to stutter the
+    GUI, so the stat/scandir work runs off the GUI thread and only the
+    resulting file map is handed back through a queued signal.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(dict)
+
+    def __init__(self, dir_cache):
+        super().__init__()
+        self.signals = self.Signals()
+        self._dir_cache = dir_cache
+
+    def run(self):
+        current_files = {}  # rel_path -> display text
+
+        if os.path.exists(UPLOAD_FOLDER):
+            # Re-scan a directory only when its mtime moved; on an idle
+            # poll this costs one stat per directory instead of one per file
+            def scan_dir(path):
+                try:
+                    dir_mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    return
+
+                cached = self._dir_cache.get(path)
+                if cached is not None and cached[0] == dir_mtime:
+                    files, subdirs = cached[1], cached[2]
+                else:
+                    files = {}
+                    subdirs = []
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            if entry.name.startswith('.'):
+                                # Skip internal folders such as the upload staging area
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry.stat()
+                                rel_path = os.path.relpath(entry.path, UPLOAD_FOLDER)
+                                mtime = datetime.fromtimestamp(st.st_mtime)
+                                files[rel_path] = f"{rel_path} ({st.st_size} bytes, {mtime.strftime('%Y-%m-%d %H:%M:%S')})"
+                    self._dir_cache[path] = (dir_mtime, files, subdirs)
+
+                current_files.update(files)
+                for subdir in subdirs:
+                    scan_dir(subdir)
+
+            scan_dir(UPLOAD_FOLDER)
+
+        self.signals.finished.emit(current_files)
+
+
+class _QrRenderTask(QRunnable):
+    """Renders a QR code into a QImage on the thread pool
+
+    Painting the module matrix straight into a QImage skips the PIL
+    render, PNG encode, and pixmap decode the qrcode image backend
+    would otherwise cost - and running it here keeps the Reed-Solomon
+    encoding work out of the GUI thread. QImage is thread-safe to
+    build; the QPixmap conversion happens in the receiving slot.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(str, QImage)
+
+    def __init__(self, ip, qr_data):
+        super().__init__()
+        self.signals = self.Signals()
+        self._ip = ip
+        self._qr_data = qr_data
+
+    def run(self):
+        qr = qrcode.QRCode(box_size=1, border=1)
+        qr.add_data(self._qr_data)
+        qr.make()
+        matrix = qr.get_matrix()
+        size = len(matrix)
+
+        img = QImage(size, size, QImage.Format_RGB32)
+        img.fill(Qt.white)
+        for y, row in enumerate(matrix):
+            for x, dark in enumerate(row):
+                if dark:
+                    img.setPixel(x, y, 0xFF000000)
+
+        img = img.scaled(200, 200, Qt.KeepAspectRatio, Qt.FastTransformation)
+        self.signals.finished.emit(self._ip, img)
+
+
+class _UploadFolderWatcher(FileSystemEventHandler):
+    """Forwards watchdog filesystem events into a Qt signal
+
+    Spool and thumbnail churn is filtered out; the GUI scan skips those
+    dot folders anyway, so refreshing on their events would just burn
+    scans during every streamed upload.
+    """
+
+    def __init__(self, signal):
+        super().__init__()
+        self._signal = signal
+
+    def on_any_event(self, event):
+        if _is_internal_event(event):
+            return
+        self._signal.emit()
+
+
 class MainWindow(QMainWindow):
+    # Emitted from the watchdog thread when the upload folder changes;
+    # delivered to the GUI thread via Qt's queued connection
+    fs_event = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Orbit File Transfer")
@@ -473,6 +1369,11 @@ class MainWindow(QMainWindow):
         # Load settings and i18n data
         load_settings()
         load_i18n_data()
+
+        # Rendered QR pixmaps keyed by IP, plus the set of IPs whose
+        # render is currently in flight on the thread pool
+        self._qr_cache = {}
+        self._qr_pending = set()
         
         # Create central widget and layout
         central_widget = QWidget()
@@ -529,13 +1430,35 @@ class MainWindow(QMainWindow):
         self.upload_log = QTextEdit()
         self.upload_log.setReadOnly(True)
         self.upload_log.setMinimumHeight(250)  # Increased minimum height
+        # Keep only the most recent lines so the log's memory stays
+        # bounded no matter how long the session runs
+        self.upload_log.document().setMaximumBlockCount(5000)
         layout.addWidget(self.upload_log)
         
         # File list - reduced relative importance
-        self.file_list = QTextEdit()
-        self.file_list.setReadOnly(True)
+        self.file_list_model = QStandardItemModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_list_model)
+        self.file_list.setEditTriggers(QListView.NoEditTriggers)
         self.file_list.setMaximumHeight(150)  # Limited height for file list
         layout.addWidget(self.file_list)
+
+        # rel_path -> QStandardItem, so refreshes only touch changed rows
+        self._file_items = {}
+
+        # Per-file log lines already shown, for O(1) dedup instead of
+        # substring searches over the whole log text
+        self._logged_entries = set()
+        self._log_empty = True
+
+        # dir path -> (mtime_ns, {rel_path: text}, [subdirs]); unchanged
+        # directories are served from this cache instead of re-scanned
+        self._dir_cache = {}
+
+        # One scan runs at a time; refresh requests arriving mid-scan
+        # coalesce into a single follow-up scan
+        self._scan_running = False
+        self._scan_rerun = False
         
         # Refresh button
         self.refresh_button = QPushButton("Refresh File List")
@@ -552,10 +1475,27 @@ class MainWindow(QMainWindow):
         self.open_download_folder_button.clicked.connect(self.open_download_folder)
         layout.addWidget(self.open_download_folder_button)
         
-        # Set up auto-refresh timer (every 2 seconds)
-        self.auto_refresh_timer = QTimer()
-        self.auto_refresh_timer.timeout.connect(self.update_file_list)
-        self.auto_refresh_timer.start(2000)  # Update every 2 seconds
+        # Refresh on filesystem events when watchdog is available so the
+        # GUI does no disk I/O at all while idle; otherwise fall back to
+        # the 2-second polling timer
+        self._observer = None
+        if Observer is not None:
+            os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+            # Debounce bursts of events (large uploads fire one per chunk)
+            self._fs_debounce = QTimer()
+            self._fs_debounce.setSingleShot(True)
+            self._fs_debounce.setInterval(200)
+            self._fs_debounce.timeout.connect(self.update_file_list)
+            self.fs_event.connect(self._fs_debounce.start)
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.schedule(_UploadFolderWatcher(self.fs_event), UPLOAD_FOLDER, recursive=True)
+            self._observer.start()
+        else:
+            # Set up auto-refresh timer (every 2 seconds)
+            self.auto_refresh_timer = QTimer()
+            self.auto_refresh_timer.timeout.connect(self.update_file_list)
+            self.auto_refresh_timer.start(2000)  # Update every 2 seconds
         
         # Initialize
         self.update_file_list()
@@ -586,6 +1526,7 @@ class MainWindow(QMainWindow):
         
     def populate_interface_selector(self):
         """Populate the network interface selector with available IPs"""
+        refresh_local_ip()
         ips = get_all_local_ips()
         self.interface_selector.clear()
         for ip in ips:
@@ -601,79 +1542,127 @@ class MainWindow(QMainWindow):
             new_ip = self.interface_selector.itemData(index)
             global current_ip
             current_ip = new_ip
+            # The QR cache is keyed by IP, so switching back to a
+            # previously used interface reuses its rendered code
             self.update_ui()
     
     def start_server(self):
-        """Start the Flask server in a separate thread"""
+        """Start the Flask server on a QThread"""
+        global comm_thread
         self.comm_thread = CommunicationThread()
-        self.server_thread = threading.Thread(target=self.comm_thread.run)
-        self.server_thread.daemon = True
-        self.server_thread.start()
-        
-        # Update UI with IP and QR code after a short delay
+        self.comm_thread.update_signal.connect(self.update_file_list)
+        # Kick the IP label and QR render off the moment the IP is known
+        self.comm_thread.ip_ready.connect(self.update_ui)
+        self.comm_thread.start()
+        comm_thread = self.comm_thread
+
+        # Fallback in case IP detection hangs or fails; update_ui is
+        # idempotent, so a second call after the signal is harmless
         QTimer.singleShot(2000, self.update_ui)
         
     def update_ui(self):
         """Update UI with IP address and QR code"""
         if current_ip:
             self.ip_label.setText(f"{get_text('ip_address')}: {current_ip}:5000")
-            
-            # Generate QR code
-            qr_data = f"http://{current_ip}:5000/"
-            qr_img = qrcode.make(qr_data)
-            
-            # Convert to pixmap for display
-            buffer = io.BytesIO()
-            qr_img.save(buffer, format="PNG")
-            qr_pixmap = QPixmap()
-            qr_pixmap.loadFromData(buffer.getvalue())
-            
-            # Scale the image to fit the label
-            scaled_pixmap = qr_pixmap.scaled(200, 200, Qt.KeepAspectRatio)
-            self.qr_label.setPixmap(scaled_pixmap)
-            
+
+            # Render the QR code once per IP, off the GUI thread; the
+            # finished slot installs the pixmap when the image arrives
+            pixmap = self._qr_cache.get(current_ip)
+            if pixmap is not None:
+                self.qr_label.setPixmap(pixmap)
+            elif current_ip not in self._qr_pending:
+                self._qr_pending.add(current_ip)
+                task = _QrRenderTask(current_ip, f"http://{current_ip}:5000/")
+                task.signals.finished.connect(self._install_qr)
+                # Keep a reference so the signals object outlives the queued emit
+                self._qr_task = task
+                QThreadPool.globalInstance().start(task)
+
             self.status_label.setText("Status: Server running - Ready for connections")
         else:
             self.status_label.setText("Status: Error getting IP address")
     
+    def _install_qr(self, ip, image):
+        """Receive a rendered QR image and show it if still current
+
+        QPixmap conversion has to happen here: pixmaps are GUI-thread
+        only, while the QImage was safely built on the pool.
+        """
+        pixmap = QPixmap.fromImage(image)
+        self._qr_cache[ip] = pixmap
+        self._qr_pending.discard(ip)
+        if ip == current_ip:
+            self.qr_label.setPixmap(pixmap)
+
     def update_file_list(self):
-        """Update the list of uploaded files with improved logging"""
+        """Kick off an upload-folder scan on the thread pool
+
+        The filesystem walk runs in a _FolderScanTask; _apply_scan does
+        the widget updates back on the GUI thread.
+        """
+        if self._scan_running:
+            # A scan is in flight; remember to run once more when it
+            # lands rather than stacking tasks on the pool
+            self._scan_rerun = True
+            return
+        self._scan_running = True
+        task = _FolderScanTask(self._dir_cache)
+        task.signals.finished.connect(self._apply_scan)
+        # Keep a reference so the signals object outlives the queued emit
+        self._scan_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _apply_scan(self, current_files):
+        """Apply a finished folder scan to the log and file list"""
         global pending_log_entries
-        
-        # Keep the existing log
-        existing_log = self.upload_log.toPlainText()
-        
-        # Collect all files from root and subdirectories
-        all_files = []
-        
-        if os.path.exists(UPLOAD_FOLDER):
-            for root, dirs, files in os.walk(UPLOAD_FOLDER):
-                for filename in files:
-                    filepath = os.path.join(root, filename)
-                    if os.path.isfile(filepath):
-                        rel_path = os.path.relpath(filepath, UPLOAD_FOLDER)
-                        size = os.path.getsize(filepath)
-                        mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
-                        all_files.append(f"{rel_path} ({size} bytes, {mtime.strftime('%Y-%m-%d %H:%M:%S')})")
-        
+
         # Process pending log entries
         if pending_log_entries:
+            new_entries = []
             for entry in pending_log_entries:
-                self.upload_log.append(entry)
+                if ' - UPLOADED (' in entry:
+                    # Per-file lines are unique; skip any already shown
+                    if entry in self._logged_entries:
+                        continue
+                    self._logged_entries.add(entry)
+                new_entries.append(entry)
             # Clear the pending entries
             pending_log_entries = []
-        elif not existing_log and not all_files:
+            if new_entries:
+                # Insert the whole batch with repaints suppressed so the
+                # widget lays out and paints exactly once
+                self.upload_log.setUpdatesEnabled(False)
+                self.upload_log.moveCursor(QTextCursor.End)
+                self.upload_log.insertPlainText("\n".join(new_entries) + "\n")
+                self.upload_log.setUpdatesEnabled(True)
+                self._log_empty = False
+        elif self._log_empty and not current_files:
             # Initial state
             self.upload_log.setPlainText("No uploads yet...")
-        
-        # Update file list
-        if all_files:
-            self.file_list.setPlainText("\n".join(all_files))
-        else:
-            self.file_list.setPlainText("No files uploaded yet.")
-            
+
+        # Update file list incrementally - only touch rows that changed
+        for rel_path, text in current_files.items():
+            item = self._file_items.get(rel_path)
+            if item is None:
+                item = QStandardItem(text)
+                self.file_list_model.appendRow(item)
+                self._file_items[rel_path] = item
+            elif item.text() != text:
+                item.setText(text)
+
+        for rel_path in list(self._file_items):
+            if rel_path not in current_files:
+                item = self._file_items.pop(rel_path)
+                self.file_list_model.removeRow(item.row())
+
         # Scroll to bottom of log
         self.upload_log.moveCursor(QTextCursor.End)
+
+        self._scan_running = False
+        if self._scan_rerun:
+            # Changes arrived while scanning; pick them up in one pass
+            self._scan_rerun = False
+            self.update_file_list()
     
     def open_uploaded_folder(self):
         """Open the uploaded folder in the system file explorer"""
@@ -712,14 +1701,29 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", f"Could not open folder: {str(e)}")
 
 
-def create_templates():
-    """Create HTML templates for the web interface"""
-    template_dir = os.path.join(os.getcwd(), 'templates')
-    if not os.path.exists(template_dir):
-        os.makedirs(template_dir)
-    
-    # Mobile interface
-    mobile_html = '''<!DOCTYPE html>
+def _write_if_changed(path, content):
+    """Write content to path only when the file is missing or different
+
+    Avoids rewriting identical template files (and the associated disk
+    churn) on every launch.
+    """
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+# Page templates served from templates/; hoisted to module constants so
+# the multi-KB literals are built once at import instead of being
+# re-allocated on every create_templates() call.
+
+# Mobile interface
+MOBILE_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1114,18 +2118,50 @@ def create_templates():
                 }
             });
             
-            // Check connection status every 5 seconds
-            setInterval(checkConnection, 5000);
-            
+            // Refresh when the server announces a change instead of polling.
+            // Hidden tabs close their stream so they cost the server nothing;
+            // on return they refresh once to catch up and reconnect.
+            let es = null;
+            let pollTimer = null;
+            function connectEvents() {
+                if (es !== null || document.hidden) return;
+                es = new EventSource('/events');
+                es.onopen = () => {
+                    if (pollTimer) { clearInterval(pollTimer); pollTimer = null; }
+                };
+                es.onmessage = e => {
+                    const d = JSON.parse(e.data);
+                    if (d.type === 'file_added') checkConnection();
+                };
+                es.onerror = () => {
+                    // Stream refused (subscriber cap reached) - fall back
+                    // to slow polling instead of going silent
+                    if (es && es.readyState === EventSource.CLOSED) {
+                        es = null;
+                        if (pollTimer === null) pollTimer = setInterval(checkConnection, 10000);
+                    }
+                };
+            }
+            document.addEventListener('visibilitychange', () => {
+                if (document.hidden) {
+                    if (es) { es.close(); es = null; }
+                    if (pollTimer) { clearInterval(pollTimer); pollTimer = null; }
+                } else {
+                    checkConnection();
+                    connectEvents();
+                }
+            });
+            connectEvents();
+
             // Initial connection check
             checkConnection();
         });
     </script>
 </body>
 </html>'''
-    
-    # Desktop interface
-    desktop_html = '''<!DOCTYPE html>
+
+# Desktop interface
+DESKTOP_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1210,26 +2246,21 @@ def create_templates():
                 
                 const fileGrid = document.getElementById('file-grid');
                 if (data.files.length > 0) {
-                    let html = '';
-                    data.files.forEach(file => {
+                    // map().join('') builds the markup in one pass instead
+                    // of growing a string per file
+                    fileGrid.innerHTML = data.files.map(file => {
                         // Determine if it's an image file to show thumbnail
                         const isImage = /\.(jpg|jpeg|png|gif|bmp|webp)$/i.test(file.name);
-                        let thumbHtml = '';
-                        
-                        if (isImage) {
-                            thumbHtml = `<img src="/uploads/${encodeURIComponent(file.name)}" alt="${file.name}" class="file-thumb">`;
-                        } else {
-                            thumbHtml = `<div style="height: 100px; display: flex; align-items: center; justify-content: center; background: #f8f9fa;">📄</div>`;
-                        }
-                        
-                        html += `
+                        const thumbHtml = isImage
+                            ? `<img src="${file.thumb_url}" alt="${file.name}" class="file-thumb">`
+                            : `<div style="height: 100px; display: flex; align-items: center; justify-content: center; background: #f8f9fa;">📄</div>`;
+                        return `
                         <div class="file-card">
                             ${thumbHtml}
                             <div class="file-name">${file.name}</div>
                             <small>${Math.round(file.size/1024)} KB</small>
                         </div>`;
-                    });
-                    fileGrid.innerHTML = html;
+                    }).join('');
                 } else {
                     fileGrid.innerHTML = '<p>No files uploaded yet.</p>';
                 }
@@ -1238,17 +2269,48 @@ def create_templates():
             }
         }
 
-        // Load status on page load and every 5 seconds
+        // Load status on page load, then refresh on server push. Hidden
+        // tabs close their stream and catch up when they become visible.
         document.addEventListener('DOMContentLoaded', () => {
             loadStatus();
-            setInterval(loadStatus, 5000);
+            let es = null;
+            let pollTimer = null;
+            function connectEvents() {
+                if (es !== null || document.hidden) return;
+                es = new EventSource('/events');
+                es.onopen = () => {
+                    if (pollTimer) { clearInterval(pollTimer); pollTimer = null; }
+                };
+                es.onmessage = e => {
+                    const d = JSON.parse(e.data);
+                    if (d.type === 'file_added') loadStatus();
+                };
+                es.onerror = () => {
+                    // Stream refused (subscriber cap reached) - fall back
+                    // to slow polling instead of going silent
+                    if (es && es.readyState === EventSource.CLOSED) {
+                        es = null;
+                        if (pollTimer === null) pollTimer = setInterval(loadStatus, 10000);
+                    }
+                };
+            }
+            document.addEventListener('visibilitychange', () => {
+                if (document.hidden) {
+                    if (es) { es.close(); es = null; }
+                    if (pollTimer) { clearInterval(pollTimer); pollTimer = null; }
+                } else {
+                    loadStatus();
+                    connectEvents();
+                }
+            });
+            connectEvents();
         });
     </script>
 </body>
 </html>'''
-    
-    # Download interface
-    download_html = '''<!DOCTYPE html>
+
+# Download interface
+DOWNLOAD_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1424,24 +2486,65 @@ def create_templates():
     </script>
 </body>
 </html>'''
-    
-    # Write mobile template
-    with open(os.path.join(template_dir, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(mobile_html)
-    
-    # Write desktop template
-    with open(os.path.join(template_dir, 'desktop.html'), 'w', encoding='utf-8') as f:
-        f.write(desktop_html)
-    
-    # Write download template
-    with open(os.path.join(template_dir, 'download.html'), 'w', encoding='utf-8') as f:
-        f.write(download_html)
+
+
+def create_templates():
+    """Write the HTML templates to disk, skipping files already up to date"""
+    template_dir = os.path.join(os.getcwd(), 'templates')
+    if not os.path.exists(template_dir):
+        os.makedirs(template_dir)
+
+    _write_if_changed(os.path.join(template_dir, 'index.html'), MOBILE_HTML)
+    _write_if_changed(os.path.join(template_dir, 'desktop.html'), DESKTOP_HTML)
+    _write_if_changed(os.path.join(template_dir, 'download.html'), DOWNLOAD_HTML)
+
+
+def run_warmup():
+    """Record the modules loaded during startup for later pre-loading"""
+    # Touch the lazily-imported modules so they land in sys.modules too
+    qrcode.QRCode  # noqa: B018 - forces the deferred import
+    names = sorted(name for name in sys.modules if not name.startswith('_'))
+    with open(WARMUP_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(names, f)
+
+
+def preload_cached_modules():
+    """Pre-import modules recorded by --warmup on a background thread
+
+    By the time the first HTTP request arrives, the modules it needs are
+    already resident instead of being imported on the request path.
+    """
+    try:
+        with open(WARMUP_CACHE_FILE, 'r', encoding='utf-8') as f:
+            names = json.load(f)
+    except Exception:
+        return
+
+    def _import_all():
+        import importlib
+        for name in names:
+            if name in sys.modules:
+                continue
+            try:
+                importlib.import_module(name)
+            except Exception:
+                continue
+
+    threading.Thread(target=_import_all, daemon=True).start()
 
 
 def main():
     if not os.path.exists(UPLOAD_FOLDER):
         os.makedirs(UPLOAD_FOLDER)
-    
+
+    # Drop any staged uploads left behind by an interrupted session
+    if os.path.isdir(INCOMING_FOLDER):
+        for leftover in os.listdir(INCOMING_FOLDER):
+            try:
+                os.remove(os.path.join(INCOMING_FOLDER, leftover))
+            except OSError:
+                pass
+
     if not os.path.exists(DOWNLOAD_FOLDER):
         os.makedirs(DOWNLOAD_FOLDER)
     
@@ -1450,8 +2553,20 @@ def main():
     load_i18n_data()
     
     create_templates()
-    
-    app_thread = threading.Thread(target=lambda: app.run(host='0.0.0.0', port=5000, debug=False, threaded=True, use_reloader=False))
+
+    # Warm remaining imports in the background while the GUI comes up
+    preload_cached_modules()
+
+    # Invalidate the /status cache on external filesystem changes
+    _start_status_watcher()
+
+    # The server stays on a daemon thread rather than its own process:
+    # the upload routes share in-process state with the GUI (the
+    # comm_thread Qt signal, pending_log_entries, upload_progress, the
+    # status cache and SSE queues), and the heavy work they do - disk
+    # writes, hashing, compression - releases the GIL anyway, so a
+    # separate interpreter would add IPC for little gain.
+    app_thread = threading.Thread(target=run_server, args=(app,))
     app_thread.daemon = True
     app_thread.start()
     
@@ -1464,4 +2579,7 @@ def main():
 
 
 if __name__ == '__main__':
+    if '--warmup' in sys.argv:
+        run_warmup()
+        sys.exit(0)
     main()
\ No newline at end of file
@@ -1,31 +1,55 @@
-import requests
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
 
-# Create a test image file
-def create_test_image():
-    # Create a simple test image using Pillow
+UPLOAD_URL = 'http://localhost:5000/upload'
+FILE_COUNT = 8
+
+
+# Create a batch of test image files
+def create_test_images(count):
+    # Create simple test images using Pillow
     from PIL import Image
-    img = Image.new('RGB', (100, 100), color='red')
-    img.save('test_image.jpg', 'JPEG')
-    return 'test_image.jpg'
+    paths = []
+    for i in range(count):
+        path = f'test_image_{i}.jpg'
+        img = Image.new('RGB', (100, 100), color='red')
+        img.save(path, 'JPEG')
+        paths.append(path)
+    return paths
+
+
+def upload_one(session, path):
+    with open(path, 'rb') as f:
+        response = session.post(UPLOAD_URL, files={'files': f})
+    return path, response
+
 
 def test_upload():
-    # Create a test image
-    test_file = create_test_image()
-    
-    # Test upload to the server
-    url = 'http://localhost:5000/upload'
-    
-    with open(test_file, 'rb') as f:
-        files = {'files': f}
-        response = requests.post(url, files=files)
-        
-        print(f"Response status: {response.status_code}")
-        print(f"Response JSON: {response.json()}")
-    
-    # Clean up test file
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    # Create the test images
+    paths = create_test_images(FILE_COUNT)
+
+    # One Session reuses kept-alive connections instead of paying a TCP
+    # handshake per request; pool is sized to match the executor
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+    try:
+        # Upload in parallel so the test exercises concurrent requests
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda p: upload_one(session, p), paths))
+
+        for path, response in results:
+            print(f"{path}: status {response.status_code}")
+            print(f"  Response JSON: {response.json()}")
+    finally:
+        # Clean up test files
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
 
 if __name__ == "__main__":
-    test_upload()
\ No newline at end of file
+    test_upload()